@@ -10,6 +10,8 @@ logger.info(f"Logs for cell_neighbors will be saved to: {log_config.log_fpath}")
 logger.debug(f"Importing from local install location: {__file__}")
 
 from ._kNN import kNN
+from ._brute_force_index import BruteForceIndex
+from ._scaled_index import ScaledIndex
 
 from ._graph_query import GraphQuery, query_graph
 from ._neighbor_attribute_map import NeighborAttributeMap, map_neighbor_attributes
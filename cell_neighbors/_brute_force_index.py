@@ -0,0 +1,114 @@
+
+# -- import packages: ---------------------------------------------------------
+import numpy as np
+
+
+# -- set typing: --------------------------------------------------------------
+from typing import Optional, Tuple
+
+
+# -- operational class: -------------------------------------------------------
+class BruteForceIndex:
+    """Exact kNN index using torch: distances are computed as dense matrix
+    products (GEMM) and reduced with ``topk``. Runs on GPU when available.
+
+    Exposes the same ``query`` signature as ``voyager.Index`` so it can be
+    passed to ``query_graph``.
+    """
+
+    METRICS = ["euclidean", "angular", "dot"]
+
+    def __init__(
+        self,
+        X: np.ndarray,
+        distance_metric: str = "euclidean",
+        device: Optional[str] = None,
+        max_block_bytes: int = 2 ** 28,
+    ) -> None:
+        """
+        Args:
+            X (np.ndarray): Data of shape (n_obs, n_dim) to index.
+
+            distance_metric (str): One of ``"euclidean"``, ``"angular"`` or ``"dot"``.
+            **Default**: ``"euclidean"``.
+
+            device (Optional[str]): torch device. ``None`` selects ``"cuda"`` if
+            available, otherwise ``"cpu"``. **Default**: ``None``.
+
+            max_block_bytes (int): Memory budget for one (n_block, n_obs) float32
+            distance block; the number of queries per block is derived from it.
+            **Default**: 256 MiB.
+        """
+        import torch
+
+        self._torch = torch
+        if distance_metric not in self.METRICS:
+            raise ValueError(
+                f"distance_metric: '{distance_metric}' is not supported by the brute force index. "
+                f"Choose from: {self.METRICS}"
+            )
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+
+        self._distance_metric = distance_metric
+        self._device = device
+        self._X = self._prepare(torch.as_tensor(X, dtype=torch.float32, device=device))
+        self._block_size = max(1, max_block_bytes // (4 * self._X.shape[0]))
+
+    def _prepare(self, X):
+        if self._distance_metric == "angular":
+            return self._torch.nn.functional.normalize(X, dim=1)
+        return X
+
+    def __len__(self) -> int:
+        return self._X.shape[0]
+
+    def _search(self, X_query, k: int):
+        if self._distance_metric == "euclidean":
+            return self._torch.cdist(X_query, self._X).topk(k, dim=1, largest=False)
+        sim, ids = (X_query @ self._X.T).topk(k, dim=1, largest=True)
+        if self._distance_metric == "angular":
+            # -- same convention as annoy: sqrt(2 * (1 - cos))
+            return (2 * (1 - sim)).clamp(min=0).sqrt(), ids
+        return sim, ids
+
+    def query(
+        self, X_query: np.ndarray, k: int = 20, num_threads: int = -1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the ``k`` exact nearest neighbors of each query.
+
+        Args:
+            X_query (np.ndarray): Query points of shape (n_query, n_dim).
+
+            k (int): Number of neighbors. Clamped to the number of indexed points.
+            **Default**: 20.
+
+            num_threads (int): Number of CPU threads used by torch when running on
+            CPU; ``-1`` keeps the current torch setting. Ignored on GPU.
+            **Default**: -1.
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray]): neighbor ids and distances, each of
+            shape (n_query, k).
+        """
+        torch = self._torch
+        k = min(k, len(self))
+        n_query = X_query.shape[0]
+        ids = np.empty((n_query, k), dtype=np.int32)
+        dists = np.empty((n_query, k), dtype=np.float32)
+        X_query = torch.as_tensor(
+            np.ascontiguousarray(X_query, dtype=np.float32), device=self._device
+        )
+        n_threads = torch.get_num_threads()
+        if num_threads > 0 and X_query.device.type == "cpu":
+            torch.set_num_threads(num_threads)
+        try:
+            with torch.no_grad():
+                for start in range(0, n_query, self._block_size):
+                    stop = min(start + self._block_size, n_query)
+                    d, i = self._search(self._prepare(X_query[start:stop]), k)
+                    ids[start:stop] = i.cpu().numpy()
+                    dists[start:stop] = d.cpu().numpy()
+        finally:
+            torch.set_num_threads(n_threads)
+        return ids, dists
@@ -1,32 +1,65 @@
 
 # -- import packages: ---------------------------------------------------------
-import ABCParse
 import numpy as np
 import annoy
+import os
 
 
-# -- set typing: --------------------------------------------------------------
-from typing import Generator, Optional
+# -- set up logger: -----------------------------------------------------------
+import logging
 
+logger = logging.getLogger(__name__)
 
-# -- operational class: -------------------------------------------------------
-class GraphQuery(ABCParse.ABCParse):
-    def __init__(self, *args, **kwargs) -> None:
-        self.__parse__(locals())
 
-    def forward(self) -> Generator:
-        """Runs as a generator: `get_nns_by_vector`."""
-        for x_query in self._X_query:
-            yield self._idx.get_nns_by_vector(x_query, self._n_neighbors)
+# -- set typing: --------------------------------------------------------------
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
 
-    def _format(self, output: Generator) -> np.ndarray:
-        return np.array(list(output))
+# -- operational class: -------------------------------------------------------
+class GraphQuery:
+
+    @property
+    def _max_workers(self) -> int:
+        if self._n_jobs is None or self._n_jobs < 1:
+            return os.cpu_count() or 1
+        return self._n_jobs
+
+    def _query_chunk(self, bounds: Tuple[int, int]) -> None:
+        start, stop = bounds
+        for i in range(start, stop):
+            nn = self._idx.get_nns_by_vector(
+                self._X_query[i].tolist(), self._n_neighbors, search_k=self._search_k
+            )
+            self._out[i, : len(nn)] = nn
+
+    def forward(self) -> np.ndarray:
+        """Dispatch `get_nns_by_vector` across a thread pool, filling the
+        preallocated output in place. Annoy releases the GIL during the
+        search, so query chunks run concurrently.
+
+        Annoy may return fewer than ``n_neighbors`` ids (e.g., with a small
+        ``search_k``); the remaining entries of that row are padded with -1.
+        """
+        n_query = self._X_query.shape[0]
+        self._out = np.full((n_query, self._n_neighbors), -1, dtype=np.int32)
+        n_workers = self._max_workers
+        chunksize = max(1, n_query // (8 * n_workers))
+        bounds = [
+            (start, min(start + chunksize, n_query))
+            for start in range(0, n_query, chunksize)
+        ]
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(self._query_chunk, bounds))
+        return self._out
 
     def __call__(
         self,
         idx: annoy.AnnoyIndex,
         X_query: np.ndarray,
         n_neighbors: int = 20,
+        search_k: int = -1,
+        n_jobs: Optional[int] = -1,
         *args,
         **kwargs,
     ) -> np.ndarray:
@@ -37,27 +70,60 @@ class GraphQuery(ABCParse.ABCParse):
 
             X_query (np.ndarray)
 
-            n_neighbors (int): Number of neighbors to return. **Default**: 20.
+            n_neighbors (int): Number of neighbors to return. Clamped to the number
+            of items in the index. **Default**: 20.
+
+            search_k (int): Number of nodes to inspect during the search. ``-1``
+            uses the Annoy default. **Default**: -1.
+
+            n_jobs (Optional[int]): Number of threads used to run queries. ``-1``
+            or ``None`` uses all available cores. **Default**: -1.
 
         Returns:
-            (np.ndarray)
+            (np.ndarray): Neighbor ids of shape (n_query, n_neighbors). Rows for which
+            Annoy returned fewer ids are padded with -1.
         """
-        self.__update__(locals())
+        self._idx = idx
+        self._X_query = np.ascontiguousarray(X_query, dtype=np.float32)
+        self._n_neighbors = min(n_neighbors, idx.get_n_items())
+        self._search_k = search_k
+        self._n_jobs = n_jobs
 
-        print(f"X_query shape: {X_query.shape}")
+        logger.debug("X_query shape: %s", X_query.shape)
 
-        return self._format(self.forward())
+        return self.forward()
 
 
 # -- API-facing function: -----------------------------------------------------
-def query_graph(idx, X_query: np.ndarray, n_neighbors=20):
+def query_graph(
+    idx, X_query: np.ndarray, n_neighbors=20, search_k: int = -1, n_jobs: Optional[int] = -1
+):
     """
     Args:
-        idx
+        idx (annoy.AnnoyIndex | voyager.Index | ScaledIndex | BruteForceIndex)
         
         X_query (np.ndarray)
         
-        n_neighbors (int)
+        n_neighbors (int): Clamped to the number of items in the index.
+
+        search_k (int): Only used for ``annoy.AnnoyIndex``.
+
+        n_jobs (Optional[int])
     """
+    if not isinstance(idx, annoy.AnnoyIndex):
+        # -- voyager.Index / ScaledIndex / BruteForceIndex: batched query in a single call
+        mapped_nn, _ = idx.query(
+            np.ascontiguousarray(X_query, dtype=np.float32),
+            k=min(n_neighbors, len(idx)),
+            num_threads=-1 if n_jobs is None else n_jobs,
+        )
+        return mapped_nn.astype(np.int32)
+
     query = GraphQuery()
-    return query(idx=idx, X_query=X_query, n_neighbors=n_neighbors)
+    return query(
+        idx=idx,
+        X_query=X_query,
+        n_neighbors=n_neighbors,
+        search_k=search_k,
+        n_jobs=n_jobs,
+    )
@@ -20,11 +20,28 @@ from typing import Optional
 
 # -- import local dependencies: -----------------------------------------------
 from ._neighbor_query import NeighborQuery
+from ._brute_force_index import BruteForceIndex
+from ._scaled_index import ScaledIndex
+
+
+# -- annoy distance metric -> voyager.Space: ----------------------------------
+VOYAGER_SPACES = {
+    "euclidean": "Euclidean",
+    "angular": "Cosine",
+    "dot": "InnerProduct",
+}
+
+VOYAGER_STORAGE_DTYPES = {
+    "float32": "Float32",
+    "float8": "Float8",
+    "e4m3": "E4M3",
+}
 
 
 # -- operational class: -------------------------------------------------------
 class kNN(ABCParse.ABCParse):
-    """Container for kNN graph using annoy.AnnoyIndex.
+    """Container for kNN graph using annoy.AnnoyIndex, voyager.Index or an exact
+    (torch) brute force index.
 
     Attributes:
         _knn_idx_built (bool): Indicates whether the kNN index has been built.
@@ -37,8 +54,10 @@ class kNN(ABCParse.ABCParse):
 
         _distance_metric (str): The distance metric used for building the Annoy index.
 
+        _backend (str): The nearest neighbor library used to build the index.
+
     Methods:
-        query(X_query: np.ndarray, obs_key: Optional[str] = None, label_only: bool = True):
+        query(X_query: np.ndarray, obs_key: Optional[str] = None, label_only: bool = True, n_neighbors: int = 20, n_jobs: Optional[int] = -1):
             Query the kNN graph for neighbors of a given set of query points.
     """
     @py_pkg_logging.log_function_call(logger)
@@ -48,6 +67,9 @@ class kNN(ABCParse.ABCParse):
         use_key: str = "X_pca",
         n_trees: int = 10,
         distance_metric: str = "euclidean",
+        backend: str = "annoy",
+        device: Optional[str] = None,
+        storage_dtype: str = "float32",
         *args,
         **kwargs,
     ) -> None:
@@ -62,6 +84,20 @@ class kNN(ABCParse.ABCParse):
             n_trees (int): The number of trees to build the Annoy index.
             
             distance_metric (str): The distance metric used for building the Annoy index.
+
+            backend (str): Nearest neighbor library used to build the index. One of
+            ``"annoy"`` (random projection forest), ``"voyager"`` (HNSW graph;
+            requires ``voyager``) or ``"torch"`` (exact brute force search, on GPU
+            when available; requires ``torch``). ``n_trees`` only applies to
+            ``"annoy"``. **Default**: ``"annoy"``.
+
+            device (Optional[str]): torch device for ``backend="torch"``. ``None``
+            selects ``"cuda"`` if available. **Default**: ``None``.
+
+            storage_dtype (str): Vector storage type for ``backend="voyager"``. One of
+            ``"float32"``, ``"float8"`` (8-bit scalar quantization; data and queries are
+            scaled by one global factor into [-1, 1], which preserves neighbor order) or
+            ``"e4m3"`` (8-bit float). **Default**: ``"float32"``.
             
             *args: Additional positional arguments.
             
@@ -76,14 +112,18 @@ class kNN(ABCParse.ABCParse):
 
     @property
     def X_use(self) -> np.ndarray:
-        """Property to access the data used for building the kNN graph.
+        """Property to access the data used for building the kNN graph. Fetched
+        once and stored as a contiguous float32 array.
 
         Returns:
             np.ndarray: The data used for building the kNN graph.
         """
         if not hasattr(self, "_X_use"):
-            self._X_use = adata_query.fetch(
-                self.adata, key=self._use_key, groupby=None, torch=False
+            self._X_use = np.ascontiguousarray(
+                adata_query.fetch(
+                    self.adata, key=self._use_key, groupby=None, torch=False
+                ),
+                dtype=np.float32,
             )
         return self._X_use
 
@@ -105,25 +145,80 @@ class kNN(ABCParse.ABCParse):
         """
         return self.X_use.shape[1]
     
+    def _build_annoy_index(self) -> annoy.AnnoyIndex:
+        idx = annoy.AnnoyIndex(self._n_dim, self._distance_metric)
+        # -- annoy reads items element-wise; rows of python floats skip a numpy
+        # -- scalar allocation per element
+        for i, x in enumerate(self.X_use):
+            idx.add_item(i, x.tolist())
+        idx.build(self._n_trees, n_jobs=-1)
+        return idx
+
+    def _build_voyager_index(self):
+        import voyager
+
+        if self._distance_metric not in VOYAGER_SPACES:
+            raise ValueError(
+                f"distance_metric: '{self._distance_metric}' is not supported by voyager. "
+                f"Choose from: {list(VOYAGER_SPACES)}"
+            )
+        space = getattr(voyager.Space, VOYAGER_SPACES[self._distance_metric])
+        storage_data_type = getattr(
+            voyager.StorageDataType, VOYAGER_STORAGE_DTYPES[self._storage_dtype]
+        )
+        idx = voyager.Index(
+            space, num_dimensions=self._n_dim, storage_data_type=storage_data_type
+        )
+        if self._storage_dtype == "float8":
+            # -- Float8 stores round(127 * x) for x in [-1, 1]; the scale is kept
+            # -- with the index so every query path applies it
+            scale = 1 / (float(np.abs(self.X_use).max()) or 1.0)
+            idx.add_items(self.X_use * np.float32(scale), num_threads=-1)
+            return ScaledIndex(idx, scale)
+        idx.add_items(self.X_use, num_threads=-1)
+        return idx
+
+    def _build_torch_index(self) -> BruteForceIndex:
+        return BruteForceIndex(
+            self.X_use, distance_metric=self._distance_metric, device=self._device
+        )
+
     @py_pkg_logging.log_function_call(logger)
-    def _build_index(self) -> annoy.AnnoyIndex:
-        """Build the Annoy index for the kNN graph.
+    def _build_index(self):
+        """Build the index for the kNN graph, using the configured backend.
 
         Returns:
-            annoy.AnnoyIndex: The Annoy index built for the kNN graph.
+            annoy.AnnoyIndex | voyager.Index | ScaledIndex | BruteForceIndex: The index built for the kNN graph.
         """
-        idx = annoy.AnnoyIndex(self._n_dim, self._distance_metric)
-        [idx.add_item(i, self.X_use[i]) for i in range(self._n_obs)]
-        idx.build(self._n_trees)
+        if self._storage_dtype not in VOYAGER_STORAGE_DTYPES:
+            raise ValueError(
+                f"storage_dtype: '{self._storage_dtype}' is not supported. "
+                f"Choose from: {list(VOYAGER_STORAGE_DTYPES)}"
+            )
+        if self._storage_dtype != "float32" and self._backend != "voyager":
+            raise ValueError(
+                f"storage_dtype: '{self._storage_dtype}' requires backend='voyager'; "
+                f"backend '{self._backend}' only supports 'float32'"
+            )
+        if self._backend == "annoy":
+            idx = self._build_annoy_index()
+        elif self._backend == "voyager":
+            idx = self._build_voyager_index()
+        elif self._backend == "torch":
+            idx = self._build_torch_index()
+        else:
+            raise ValueError(
+                f"backend: '{self._backend}' is not supported. Choose from: ['annoy', 'voyager', 'torch']"
+            )
         self._idx = idx
         self._knn_idx_built = True
 
     @property
-    def idx(self) -> annoy.AnnoyIndex:
-        """Property to access the Annoy index.
+    def idx(self):
+        """Property to access the index.
 
         Returns:
-            annoy.AnnoyIndex: The Annoy index for the kNN graph.
+            annoy.AnnoyIndex | voyager.Index | ScaledIndex | BruteForceIndex: The index for the kNN graph.
         """
         if not hasattr(self, "_idx"):
             self._build_index()
@@ -140,8 +235,14 @@ class kNN(ABCParse.ABCParse):
             self._neighbor_query_cls = NeighborQuery(self.idx, self.adata, self._n_dim)
         return self._neighbor_query_cls
 
-    @py_pkg_logging.log_function_call(logger)
-    def query(self, X_query: np.ndarray, obs_key: Optional[str] = None, label_only: bool = True):
+    def query(
+        self,
+        X_query: np.ndarray,
+        obs_key: Optional[str] = None,
+        label_only: bool = True,
+        n_neighbors: int = 20,
+        n_jobs: Optional[int] = -1,
+    ):
         """Query the kNN graph for neighbors of a given set of query points.
 
         Args:
@@ -152,10 +253,20 @@ class kNN(ABCParse.ABCParse):
             
             label_only (bool): Flag indicating whether to return only labels of the neighbors. **Default**: ``True``.
 
+            n_neighbors (int): Number of neighbors to return per query point. **Default**: 20.
+
+            n_jobs (Optional[int]): Number of threads used to query the index. ``-1`` or ``None`` uses all available cores. **Default**: -1.
+
         Returns:
             (NeighborQuery): The NeighborQuery instance containing information about neighbors.
         """
-        return self._query_cls(X_query, obs_key=obs_key, label_only=label_only)
+        return self._query_cls(
+            X_query,
+            obs_key=obs_key,
+            label_only=label_only,
+            n_neighbors=n_neighbors,
+            n_jobs=n_jobs,
+        )
 
     def __repr__(self) -> str:
         """
@@ -166,6 +277,8 @@ class kNN(ABCParse.ABCParse):
         """
         attrs = {
             "built": self._knn_idx_built,
+            "backend": self._backend,
+            "storage_dtype": self._storage_dtype,
             "n_obs": self._n_obs,
             "n_dim": self._n_dim,
         }
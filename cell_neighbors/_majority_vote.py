@@ -0,0 +1,47 @@
+
+# -- import packages: ---------------------------------------------------------
+import numba
+import numpy as np
+import pandas as pd
+
+
+# -- numba kernel: ------------------------------------------------------------
+@numba.njit(parallel=True, cache=True)
+def majority_vote(codes: np.ndarray, n_classes: int) -> np.ndarray:
+    """Most frequent non-negative code in each row of ``codes``.
+
+    Args:
+        codes (np.ndarray): Integer codes of shape (n_query, n_neighbors). Negative
+        codes denote missing values and are not counted.
+
+        n_classes (int): Number of distinct codes.
+
+    Returns:
+        (np.ndarray): Winning code per row, or -1 if a row has no observed codes. Ties
+        resolve to the smallest code.
+    """
+    n_query, n_neighbors = codes.shape
+    mode = np.empty(n_query, np.int64)
+    for i in numba.prange(n_query):
+        counts = np.zeros(n_classes, np.int32)
+        n_observed = 0
+        for j in range(n_neighbors):
+            c = codes[i, j]
+            if c >= 0:
+                counts[c] += 1
+                n_observed += 1
+        if n_observed > 0:
+            mode[i] = counts.argmax()
+        else:
+            mode[i] = -1
+    return mode
+
+
+# -- decode: ------------------------------------------------------------------
+def decode_labels(mode: np.ndarray, categories: pd.Index) -> pd.Series:
+    """Map winning codes back to categories; -1 becomes NaN."""
+    if (mode < 0).any():
+        return pd.Series(
+            categories.astype(object).take(mode, allow_fill=True, fill_value=np.nan)
+        )
+    return pd.Series(categories.take(mode))
@@ -1,11 +1,21 @@
 
 # -- import packages: ---
 import ABCParse
+import numpy as np
 import pandas as pd
 
 
 # -- set typing: ----
-from typing import Generator, Tuple
+from typing import Tuple
+
+
+# -- import local dependencies: ---
+from ._majority_vote import majority_vote, decode_labels
+
+
+# -- bincount accumulator size per block (~L2 cache): ---
+COUNT_BLOCK_BYTES = 2 ** 18
+
 
 class NeighborAttributeCounter(ABCParse.ABCParse):
     """
@@ -30,19 +40,48 @@ class NeighborAttributeCounter(ABCParse.ABCParse):
             **kwargs: Additional keyword arguments.
         """
         self.__parse__(locals())
+        self._count_df = None
 
-    def count(self, df: pd.DataFrame) -> Generator:
+    def _factorize(self, df: pd.DataFrame) -> Tuple[np.ndarray, pd.Index]:
+        """Encode the values of ``df`` as integer codes, one row of codes per
+        column of ``df``. Missing values are encoded as -1."""
+        codes, uniques = pd.factorize(df.to_numpy().ravel(order="F"))
+        return codes.reshape(df.shape[1], df.shape[0]), pd.Index(uniques)
+
+    def count(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Counts the occurrences of each attribute value in the DataFrame.
+        Counts the occurrences of each attribute value in each column of the DataFrame.
+        Values are factorized once and counted with ``np.bincount`` in blocks of columns
+        sized so that each block's accumulator stays in cache.
 
         Args:
             df (pd.DataFrame): The DataFrame for which attribute counts are to be calculated.
 
-        Yields:
-            dict: A dictionary containing attribute values as keys and their counts as values.
+        Returns:
+            pd.DataFrame: One row per column of ``df``, one column per attribute value.
         """
-        for col in df:
-            yield df[col].value_counts().to_dict()
+        codes, uniques = self._factorize(df)
+        n_cols, n_rows = codes.shape
+        n_uniques = len(uniques)
+        counts = np.zeros((n_cols, n_uniques), dtype=np.int32)
+        block = max(1, COUNT_BLOCK_BYTES // (8 * max(n_uniques, 1)))
+        for start in range(0, n_cols, block):
+            stop = min(start + block, n_cols)
+            block_codes = codes[start:stop]
+            observed = block_codes >= 0
+            block_idx = np.broadcast_to(
+                np.arange(stop - start)[:, None], block_codes.shape
+            )
+            counts[start:stop] = np.bincount(
+                block_idx[observed] * n_uniques + block_codes[observed],
+                minlength=(stop - start) * n_uniques,
+            ).reshape(stop - start, n_uniques)
+        return pd.DataFrame(counts, index=df.columns, columns=uniques)
+
+    @property
+    def _count_df_built(self) -> bool:
+        """Whether ``count_df`` has already been computed."""
+        return self._count_df is not None
 
     @property
     def count_df(self):
@@ -51,18 +90,25 @@ class NeighborAttributeCounter(ABCParse.ABCParse):
         Returns:
             count_df (pd.DataFrame): DataFrame containing counts of attribute values.
         """
-        if not hasattr(self, "_count_df"):
-            self._count_df = pd.DataFrame(list(self.count(self._attr_df))).fillna(0)
+        if not self._count_df_built:
+            self._count_df = self.count(self._attr_df)
         return self._count_df
 
     @property
     def labels(self) -> pd.Series:
-        """Property to retrieve the labels of the most frequent attributes.
+        """Property to retrieve the labels of the most frequent attributes. If
+        ``count_df`` has not been computed, labels are taken from the per-column
+        mode of the encoded values, without building ``count_df``.
 
         Returns:
             labels (pd.Series): Series containing labels of the most frequent attributes.
         """
-        return self.count_df.idxmax(1)
+        if self._count_df_built:
+            return self.count_df.idxmax(1)
+        codes, uniques = self._factorize(self._attr_df)
+        labels = decode_labels(majority_vote(codes, len(uniques)), uniques)
+        labels.index = self._attr_df.columns
+        return labels
         
         
 def count_neighbor_attributes(attr_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
@@ -1,9 +1,14 @@
 
 import ABCParse
 import anndata
+import functools
 import pandas as pd
 import numpy as np
 
+from typing import Tuple, Union
+
+from ._majority_vote import majority_vote, decode_labels
+
 
 class NeighborAttributeMap(ABCParse.ABCParse):
     """
@@ -15,8 +20,11 @@ class NeighborAttributeMap(ABCParse.ABCParse):
         _mapped_nn (np.ndarray): An array containing mapped neighbor indices.
 
     Methods:
-        __call__(mapped_nn: np.ndarray, obs_key: str, *args, **kwargs): Calls the instance and returns the query DataFrame.
+        __call__(mapped_nn: np.ndarray, obs_key: str, label_only: bool = False, *args, **kwargs): Calls the instance and returns the query DataFrame or the neighbor labels.
     """
+
+    _CACHED_ATTRS = ("n_neighbors", "_has_missing_nn", "query_df", "_neighbor_codes")
+
     def __init__(self, adata: anndata.AnnData, *args, **kwargs):
         """Initializes the NeighborAttributeMap instance.
 
@@ -27,16 +35,7 @@ class NeighborAttributeMap(ABCParse.ABCParse):
         """
         self.__parse__(locals())
 
-    @property
-    def nn(self) -> np.ndarray:
-        """Property to access flattened mapped neighbor indices.
-
-        Returns:
-            np.ndarray: Flattened array of mapped neighbor indices.
-        """
-        return self._mapped_nn.flatten()
-
-    @property
+    @functools.cached_property
     def n_neighbors(self) -> int:
         """
         Property to access the number of neighbors.
@@ -46,52 +45,110 @@ class NeighborAttributeMap(ABCParse.ABCParse):
         """
         return self._mapped_nn.shape[-1]
 
-    @property
-    def _nn_adata(self) -> anndata.AnnData:
-        """Property to access the AnnData object with mapped neighbor indices.
+    @functools.cached_property
+    def _has_missing_nn(self) -> bool:
+        """Property indicating whether ``mapped_nn`` contains -1 padding (rows for
+        which fewer than ``n_neighbors`` neighbors were found).
 
         Returns:
-            anndata.AnnData: AnnData object containing mapped neighbor data.
+            bool: True if any neighbor index is -1.
         """
-        return self._adata[self.nn]
+        return bool((self._mapped_nn < 0).any())
 
-    @property
+    @functools.cached_property
     def query_df(self) -> pd.DataFrame:
-        """Property to generate the query DataFrame.
+        """Property to generate the query DataFrame. Gathers directly from the
+        ``obs_key`` column rather than slicing the AnnData object.
 
         Returns:
             pd.DataFrame: DataFrame with neighbor observation attributes.
         """
-        return pd.DataFrame(
-            self._nn_adata.obs[self._obs_key].to_numpy().reshape(-1, self.n_neighbors)
-        ).T
+        obs = self._adata.obs[self._obs_key].to_numpy()
+        values = np.take(obs, self._mapped_nn)
+        if self._has_missing_nn:
+            values = np.where(self._mapped_nn < 0, None, values)
+        return pd.DataFrame(values.reshape(-1, self.n_neighbors)).T
+
+    @functools.cached_property
+    def _neighbor_codes(self) -> Tuple[np.ndarray, pd.Index]:
+        """Property to access the ``obs_key`` attributes of the mapped neighbors as
+        integer codes of shape (n_query, n_neighbors). Only the gathered values are
+        factorized, so the cost does not scale with n_obs, and codes follow order of
+        first appearance (as in ``NeighborAttributeCounter``) so that ties resolve
+        the same way as ``count_df.idxmax(1)``. Categorical columns gather their
+        existing codes and map the uniques back through the categories.
+
+        Returns:
+            Tuple[np.ndarray, pd.Index]: Integer codes (-1 for missing) and categories.
+        """
+        obs = self._adata.obs[self._obs_key]
+        mapped_nn = self._mapped_nn.ravel()
+        observed = mapped_nn >= 0
+        is_categorical = isinstance(obs.dtype, pd.CategoricalDtype)
+        if is_categorical:
+            gathered = np.take(obs.cat.codes.to_numpy(), mapped_nn)
+            observed &= gathered >= 0
+        else:
+            gathered = np.take(obs.to_numpy(), mapped_nn)
+        codes = np.full(mapped_nn.shape, -1, dtype=np.intp)
+        observed_codes, uniques = pd.factorize(gathered[observed])
+        codes[observed] = observed_codes
+        if is_categorical:
+            categories = obs.cat.categories.take(uniques)
+        else:
+            categories = pd.Index(uniques)
+        return codes.reshape(-1, self.n_neighbors), categories
+
+    @property
+    def labels(self) -> pd.Series:
+        """Property to access the most frequent neighbor attribute of each query.
+        Neighbor codes are gathered and voted on in integer space (numba, parallel
+        over queries); only the winning codes are mapped back to categories.
+
+        Returns:
+            pd.Series: Most frequent neighbor attribute for each query.
+        """
+        codes, categories = self._neighbor_codes
+        return decode_labels(majority_vote(codes, len(categories)), categories)
 
-    def __call__(self, mapped_nn: np.ndarray, obs_key, *args, **kwargs):
+    def __call__(
+        self, mapped_nn: np.ndarray, obs_key, label_only: bool = False, *args, **kwargs
+    ) -> Union[pd.DataFrame, pd.Series]:
         """Calls the instance and returns the query DataFrame.
 
         Args:
             mapped_nn (np.ndarray): An array containing mapped neighbor indices.
             obs_key (str): The key for accessing observation attributes.
+            label_only (bool): Return only the most frequent attribute of each query. **Default**: ``False``.
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
 
         Returns:
-            pd.DataFrame: DataFrame with neighbor observation attributes.
+            pd.DataFrame | pd.Series: DataFrame with neighbor observation attributes or,
+            if ``label_only``, the most frequent attribute of each query.
         """
         self.__update__(locals())
+        for attr in self._CACHED_ATTRS:
+            self.__dict__.pop(attr, None)
+        if label_only:
+            return self.labels
         return self.query_df
     
     
-def map_neighbor_attributes(adata, mapped_nn, obs_key) -> pd.DataFrame:
+def map_neighbor_attributes(
+    adata, mapped_nn, obs_key, label_only: bool = False
+) -> Union[pd.DataFrame, pd.Series]:
     """Map neighbor attributes in the provided AnnData object.
 
     Args:
         adata (anndata.AnnData): An AnnData object containing data.
         mapped_nn (np.ndarray): An array containing mapped neighbor indices.
         obs_key (str): The key for accessing observation attributes.
+        label_only (bool): Return only the most frequent attribute of each query. **Default**: ``False``.
 
     Returns:
-        pd.DataFrame: DataFrame with neighbor observation attributes.
+        pd.DataFrame | pd.Series: DataFrame with neighbor observation attributes or,
+        if ``label_only``, the most frequent attribute of each query.
     """
     neighbor_attrs = NeighborAttributeMap(adata=adata)
-    return neighbor_attrs(mapped_nn=mapped_nn, obs_key=obs_key)
+    return neighbor_attrs(mapped_nn=mapped_nn, obs_key=obs_key, label_only=label_only)
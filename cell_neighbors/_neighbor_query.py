@@ -52,6 +52,9 @@ class NeighborQuery(ABCParse.ABCParse):
             None
         """
         self.__parse__(locals())
+        self._obs_key = None
+        self._mapped_nn = None
+        self._attribute_counter = None
 
     @property
     def _IS_MULTI_QUERY(self) -> bool:
@@ -66,12 +69,20 @@ class NeighborQuery(ABCParse.ABCParse):
     @property
     def mapped_nn(self) -> np.ndarray:
         """
-        Queries the graph and returns the mapped nearest neighbors.
+        Queries the graph and returns the mapped nearest neighbors. The result is
+        cached until the next `NeighborQuery.__call__`.
 
         Returns:
             (np.ndarray): The mapped nearest neighbors.
         """
-        return query_graph(self._idx, self._X_query)
+        if self._mapped_nn is None:
+            self._mapped_nn = query_graph(
+                self._idx,
+                self._X_query,
+                n_neighbors=self._n_neighbors,
+                n_jobs=self._n_jobs,
+            )
+        return self._mapped_nn
 
     @property
     def attr_df(self) -> pd.DataFrame:
@@ -84,7 +95,7 @@ class NeighborQuery(ABCParse.ABCParse):
         Raises:
             Exception: If 'obs_key' is not passed during `NeighborQuery.__call__`.
         """
-        if not hasattr(self, "_obs_key"):
+        if self._obs_key is None:
             raise Exception(
                 "To map attributes to neighbors, pass `obs_key` during `NeighborQuery.__call__`"
             )
@@ -98,7 +109,7 @@ class NeighborQuery(ABCParse.ABCParse):
         Returns:
             (NeighborAttributeCounter): The counter object for neighbor attributes.
         """
-        if not hasattr(self, "_attribute_counter"):
+        if self._attribute_counter is None:
             self._attribute_counter = NeighborAttributeCounter(self.attr_df)
         return self._attribute_counter
 
@@ -113,19 +124,15 @@ class NeighborQuery(ABCParse.ABCParse):
 
     @property
     def labels(self):
-        """Provides labels for the attributes. If it's a multi-query, the
-        labels are reshaped accordingly.
+        """Provides labels for the attributes, one per (flattened) query.
 
         Returns:
-            (pd.DataFrame): Labels for the attributes.
+            (pd.Series): Labels for the attributes.
         """
-        if self._IS_MULTI_QUERY:
-            return pd.DataFrame(
-                self.attribute_counter.labels.values.reshape(-1, self._X_query.shape[0])
-            )
-        return self.attribute_counter.labels
+        return map_neighbor_attributes(
+            self._adata, self.mapped_nn, self._obs_key, label_only=True
+        )
     
-    @py_pkg_logging.log_function_call(logger)
     def _sub_call(self):
         """Internal method to handle sub-calls based on the presenceof 'obs_key' and
         'label_only' flags.
@@ -140,9 +147,15 @@ class NeighborQuery(ABCParse.ABCParse):
             return self.count_df
         return self.mapped_nn
     
-    @py_pkg_logging.log_function_call(logger)
     def __call__(
-        self, X_query, obs_key: Optional[str] = None, label_only=True, *args, **kwargs
+        self,
+        X_query,
+        obs_key: Optional[str] = None,
+        label_only=True,
+        n_neighbors: int = 20,
+        n_jobs: Optional[int] = -1,
+        *args,
+        **kwargs,
     ):
         """
         Calls the NeighborQuery with the given query matrix and optional observation
@@ -154,29 +167,32 @@ class NeighborQuery(ABCParse.ABCParse):
             obs_key (Optional[str]): Key to observation attributes in the annotated data
             matrix. Default is None. label_only (bool): Flag to indicate whether only labels
             should be returned. Default is True.
+            n_neighbors (int): Number of neighbors to return per query. Default is 20.
+            n_jobs (Optional[int]): Number of threads used to query the index. ``-1`` or
+            ``None`` uses all available cores. Default is -1.
 
         Returns:
             Various: Depending on the query and flags, it returns labels, count DataFrame, or
-            mapped nearest neighbors.
+            mapped nearest neighbors. For a multi-query of shape (..., n_dim), labels are
+            returned with shape (...) and mapped nearest neighbors with shape
+            (..., n_neighbors).
         """
-        self.__update__(locals())
-        
-        if hasattr(self, "_attribute_counter"):
-            del self._attribute_counter
-
+        # -- plain assignment: the hot path bypasses ABCParse.__update__
+        self._X_query = X_query
         self._obs_key = obs_key
-        self.query_shape = self._X_query.shape
+        self._label_only = label_only
+        self._n_neighbors = n_neighbors
+        self._n_jobs = n_jobs
+        self._mapped_nn = None
+        self._attribute_counter = None
+        self.query_shape = X_query.shape
 
         if self._IS_MULTI_QUERY:
             self._X_query = self._X_query.reshape(-1, self._n_dim)
-            print(f"Multi-query, new shape: {self._X_query.shape}")
+            logger.debug("Multi-query, new shape: %s", self._X_query.shape)
             if self._obs_key and self._label_only:
-                return pd.DataFrame(
-                    self._sub_call().values.reshape(-1, self.query_shape[0])
-                )
+                return self._sub_call().to_numpy().reshape(self.query_shape[:-1])
             if not self._obs_key:
-                return self._sub_call().reshape(
-                    self.query_shape[0], self.query_shape[1], -1
-                )
+                return self._sub_call().reshape(*self.query_shape[:-1], -1)
 
         return self._sub_call()
@@ -0,0 +1,45 @@
+
+# -- import packages: ---------------------------------------------------------
+import numpy as np
+
+
+# -- set typing: --------------------------------------------------------------
+from typing import Tuple
+
+
+# -- operational class: -------------------------------------------------------
+class ScaledIndex:
+    """Wraps an index built on uniformly rescaled data (e.g., voyager Float8
+    storage) so that query points receive the same scale. Exposes the same
+    ``query`` signature as ``voyager.Index``; other attributes are forwarded to
+    the wrapped index.
+    """
+
+    def __init__(self, idx, scale: float) -> None:
+        """
+        Args:
+            idx (voyager.Index): Index built on ``X * scale``.
+
+            scale (float): Factor applied to the indexed data.
+        """
+        self.idx = idx
+        self.scale = np.float32(scale)
+
+    def query(
+        self, X_query: np.ndarray, k: int = 20, num_threads: int = -1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Scale ``X_query`` and query the wrapped index.
+
+        Returns:
+            (Tuple[np.ndarray, np.ndarray]): neighbor ids and (scaled) distances.
+        """
+        X_query = np.ascontiguousarray(X_query, dtype=np.float32) * self.scale
+        return self.idx.query(X_query, k=k, num_threads=num_threads)
+
+    def __len__(self) -> int:
+        return len(self.idx)
+
+    def __getattr__(self, name):
+        if name == "idx":
+            raise AttributeError(name)
+        return getattr(self.idx, name)